@@ -1,42 +1,146 @@
 """The p2000 sensor integration."""
 from __future__ import annotations
 
+import logging
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME, Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.typing import ConfigType
 
+from .api import P2000Api
+from .config_flow import _normalize_config
 from .const import (
     CONF_CAPCODES,
     CONF_DISCIPLINES,
+    CONF_EXTRA_SOURCES,
     CONF_GEMEENTEN,
     CONF_ICON,
+    CONF_NOTIFY_RATE,
+    CONF_NOTIFY_TARGETS,
     CONF_PRIO1,
     CONF_REGIOS,
+    CONF_SCAN_INTERVAL,
     DEFAULT_ICON,
     DEFAULT_NAME,
+    DEFAULT_NOTIFY_RATE,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
 )
+from .coordinator import P2000DataUpdateCoordinator
+from .geojson import P2000GeoJsonView
+from .merger import P2000SourceMerger
+from .notifier import P2000Notifier
+
+_LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 CURRENT_CONFIG_ENTRY_VERSION = 2
 
+# Options that are applied to the running coordinator without a reload.
+HOT_APPLY_OPTIONS = {
+    CONF_CAPCODES,
+    CONF_GEMEENTEN,
+    CONF_REGIOS,
+    CONF_DISCIPLINES,
+    CONF_PRIO1,
+    CONF_SCAN_INTERVAL,
+}
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the P2000 GeoJSON view shared by all entries."""
+    hass.data.setdefault(DOMAIN, {})
+    hass.http.register_view(P2000GeoJsonView(hass))
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up P2000 from a config entry."""
+    config = {**entry.data, **entry.options}
+    api_filter = _build_api_filter(config)
+
+    _LOGGER.info("P2000 filter being used: %s", api_filter)
+    session = async_get_clientsession(hass)
+    api: P2000Api | P2000SourceMerger = P2000Api(session)
+    if extra_sources := _value_to_list(config.get(CONF_EXTRA_SOURCES)):
+        api = P2000SourceMerger(
+            hass,
+            entry,
+            {
+                "alarmeringdroid": api,
+                **{url: P2000Api(session, url) for url in extra_sources},
+            },
+        )
+
+    coordinator = P2000DataUpdateCoordinator(
+        hass=hass,
+        api=api,
+        api_filter=api_filter,
+        update_interval=_scan_interval(config),
+        entry_config=config,
+    )
+
+    await coordinator.async_config_entry_first_refresh()
+
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+
+    if targets := _value_to_list(config.get(CONF_NOTIFY_TARGETS)):
+        notifier = P2000Notifier(
+            hass, targets, int(config.get(CONF_NOTIFY_RATE) or DEFAULT_NOTIFY_RATE)
+        )
+        notifier.async_start(entry)
+        entry.async_on_unload(
+            coordinator.async_add_melding_listener(notifier.async_handle_melding)
+        )
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a P2000 config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        hass.data[DOMAIN].pop(entry.entry_id, None)
+    return unload_ok
+
+
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options, reloading only when a filter change is not enough."""
+    coordinator: P2000DataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    config = {**entry.data, **entry.options}
+
+    if _requires_reload(coordinator.entry_config, config):
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
 
+    api_filter = _build_api_filter(config)
+    _LOGGER.info("Applying P2000 filter without reload: %s", api_filter)
+    coordinator.entry_config = config
+    coordinator.async_update_filter(api_filter, _scan_interval(config))
+    await coordinator.async_request_refresh()
 
-async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload P2000 after options changed."""
-    await hass.config_entries.async_reload(entry.entry_id)
+
+def _requires_reload(old: dict[str, Any], new: dict[str, Any]) -> bool:
+    """Return True if options outside the hot-apply set changed.
+
+    Both sides are normalized first, so keys that older entries lack do not
+    count as changed when the options flow stores their defaults.
+    """
+    old, new = _normalize_config(old), _normalize_config(new)
+    keys = (old.keys() | new.keys()) - HOT_APPLY_OPTIONS
+    return any(old.get(key) != new.get(key) for key in keys)
+
+
+def _scan_interval(config: dict[str, Any]) -> int:
+    """Return the configured update interval in seconds."""
+    return int(config.get(CONF_SCAN_INTERVAL) or DEFAULT_SCAN_INTERVAL)
 
 
 def _value_to_list(value: Any) -> list[str]:
@@ -49,6 +153,22 @@ def _value_to_list(value: Any) -> list[str]:
     return [str(item).strip() for item in value if str(item).strip()]
 
 
+def _build_api_filter(config: dict[str, Any]) -> dict[str, Any]:
+    """Build the API filter from the merged entry data and options."""
+    api_filter: dict[str, Any] = {}
+    if config.get(CONF_GEMEENTEN):
+        api_filter["gemeenten"] = config[CONF_GEMEENTEN]
+    if config.get(CONF_CAPCODES):
+        api_filter["capcodes"] = config[CONF_CAPCODES]
+    if config.get(CONF_REGIOS):
+        api_filter["regios"] = config[CONF_REGIOS]
+    if config.get(CONF_DISCIPLINES):
+        api_filter["disciplines"] = config[CONF_DISCIPLINES]
+    if config.get(CONF_PRIO1):
+        api_filter["prio1"] = True
+    return api_filter
+
+
 def _to_bool(value: Any) -> bool:
     """Normalize bool-ish values."""
     if isinstance(value, bool):
@@ -3,22 +3,119 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import re
 from typing import Any
 from urllib.parse import quote
 
 import aiohttp
 
+try:
+    from aiohttp.compression_utils import HAS_BROTLI
+except ImportError:
+    HAS_BROTLI = False
+
 _LOGGER = logging.getLogger(__name__)
 
+ACCEPT_ENCODING = "br, gzip, deflate" if HAS_BROTLI else "gzip, deflate"
+MAX_RESPONSE_SIZE = 4 * 1024 * 1024
+EXECUTOR_PARSE_SIZE = 256 * 1024
+READ_CHUNK_SIZE = 64 * 1024
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class ResponseTooLarge(Exception):
+    """Raised when a response exceeds MAX_RESPONSE_SIZE."""
+
+
+def _skip_whitespace(text: str, pos: int) -> int:
+    """Return the position of the next non-whitespace character."""
+    return _WHITESPACE.match(text, pos).end()
+
+
+def _expect_separator(text: str, pos: int, end: str) -> int:
+    """Skip a comma between values, or stop before the closing character."""
+    pos = _skip_whitespace(text, pos)
+    if text[pos : pos + 1] == ",":
+        return _skip_whitespace(text, pos + 1)
+    if text[pos : pos + 1] != end:
+        raise json.JSONDecodeError(f"Expecting ',' or '{end}'", text, pos)
+    return pos
+
+
+def _normalize_melding(melding: dict[str, Any]) -> dict[str, Any]:
+    """Rename the API coordinate keys to latitude and longitude."""
+    if "lat" in melding and "latitude" not in melding:
+        melding["latitude"] = melding.pop("lat")
+    if "lon" in melding and "longitude" not in melding:
+        melding["longitude"] = melding.pop("lon")
+    return melding
+
+
+def _parse_meldingen_array(
+    text: str, pos: int, known_id: str | None
+) -> list[dict[str, Any]]:
+    """Decode array items one at a time, stopping at the known melding."""
+    meldingen: list[dict[str, Any]] = []
+    pos = _skip_whitespace(text, pos)
+    while text[pos : pos + 1] != "]":
+        melding, pos = _DECODER.raw_decode(text, pos)
+        if isinstance(melding, dict):
+            if known_id is not None and str(melding.get("id")) == known_id:
+                break
+            meldingen.append(_normalize_melding(melding))
+            if known_id is None:
+                break
+        pos = _expect_separator(text, pos, "]")
+    return meldingen
+
+
+def parse_meldingen(
+    body: bytes, encoding: str, known_id: str | None = None
+) -> list[dict[str, Any]]:
+    """Parse the meldingen newer than `known_id` from an API response.
+
+    Meldingen are returned newest first. Only the latest melding is returned
+    when there is no known melding yet. The response object is walked key by
+    key and the meldingen array item by item, so parsing stops at the first
+    melding that was already seen.
+    """
+    if known_id is not None:
+        known_id = str(known_id)
+
+    text = body.decode(encoding, errors="replace")
+    pos = _skip_whitespace(text, 0)
+    if text[pos : pos + 1] != "{":
+        raise json.JSONDecodeError("Expecting object", text, pos)
+
+    pos = _skip_whitespace(text, pos + 1)
+    while text[pos : pos + 1] != "}":
+        key, pos = _DECODER.raw_decode(text, pos)
+        pos = _skip_whitespace(text, pos)
+        if text[pos : pos + 1] != ":":
+            raise json.JSONDecodeError("Expecting ':' delimiter", text, pos)
+        pos = _skip_whitespace(text, pos + 1)
+
+        if key == "meldingen" and text[pos : pos + 1] == "[":
+            return _parse_meldingen_array(text, pos + 1, known_id)
+
+        _, pos = _DECODER.raw_decode(text, pos)
+        pos = _expect_separator(text, pos, "}")
+
+    return []
+
 
 class P2000Api:
     """Client for the P2000 API."""
 
     url = "https://beta.alarmeringdroid.nl/api2/find/"
 
-    def __init__(self, session: aiohttp.ClientSession) -> None:
-        """Initialize the API client."""
+    def __init__(self, session: aiohttp.ClientSession, url: str | None = None) -> None:
+        """Initialize the API client, optionally for another compatible source."""
         self.session = session
+        if url:
+            self.url = url
 
     async def get_data(
         self,
@@ -27,6 +124,29 @@ class P2000Api:
         timeout: int = 10,
     ) -> dict[str, Any] | None:
         """Fetch the latest P2000 notification."""
+        meldingen = await self.get_meldingen(api_filter, None, retries, timeout)
+        return meldingen[0] if meldingen else None
+
+    async def _read_body(self, response: aiohttp.ClientResponse) -> bytes:
+        """Read the decompressed response body, enforcing the size cap."""
+        if (response.content_length or 0) > MAX_RESPONSE_SIZE:
+            raise ResponseTooLarge(response.content_length)
+
+        body = bytearray()
+        async for chunk in response.content.iter_chunked(READ_CHUNK_SIZE):
+            body.extend(chunk)
+            if len(body) > MAX_RESPONSE_SIZE:
+                raise ResponseTooLarge(len(body))
+        return bytes(body)
+
+    async def get_meldingen(
+        self,
+        api_filter: dict[str, Any],
+        known_id: str | None = None,
+        retries: int = 3,
+        timeout: int = 10,
+    ) -> list[dict[str, Any]] | None:
+        """Fetch the P2000 notifications newer than `known_id`, newest first."""
         query_string = quote(json.dumps(api_filter, separators=(",", ":")), safe="")
         url = f"{self.url}{query_string}"
 
@@ -45,6 +165,10 @@ class P2000Api:
                     url,
                     allow_redirects=False,
                     timeout=client_timeout,
+                    headers={
+                        "Accept": "application/json",
+                        "Accept-Encoding": ACCEPT_ENCODING,
+                    },
                 ) as response:
                     if response.status >= 400:
                         if response.status in (408, 429) or response.status >= 500:
@@ -58,28 +182,36 @@ class P2000Api:
                         return None
 
                     try:
-                        data = await response.json(content_type=None)
-                    except (aiohttp.ContentTypeError, json.JSONDecodeError) as err:
-                        text = await response.text()
-                        _LOGGER.error("JSON decode failed: %s", err)
-                        _LOGGER.debug("Raw response (first 500 chars): %s", text[:500])
+                        body = await self._read_body(response)
+                    except ResponseTooLarge as err:
+                        _LOGGER.error(
+                            "Response larger than %s bytes (%s), ignoring it",
+                            MAX_RESPONSE_SIZE,
+                            err,
+                        )
                         return None
 
-                    meldingen = data.get("meldingen")
-                    if not meldingen:
-                        _LOGGER.debug("No notifications found in API response.")
+                    encoding = response.charset or "utf-8"
+                    try:
+                        if len(body) > EXECUTOR_PARSE_SIZE:
+                            loop = asyncio.get_running_loop()
+                            meldingen = await loop.run_in_executor(
+                                None, parse_meldingen, body, encoding, known_id
+                            )
+                        else:
+                            meldingen = parse_meldingen(body, encoding, known_id)
+                    except (LookupError, ValueError) as err:
+                        _LOGGER.error("JSON decode failed: %s", err)
+                        _LOGGER.debug(
+                            "Raw response (first 500 bytes): %s", body[:500]
+                        )
                         return None
 
-                    result = meldingen[0] if isinstance(meldingen, list) else None
-                    if not isinstance(result, dict):
+                    if not meldingen:
+                        _LOGGER.debug("No new notifications found in API response.")
                         return None
 
-                    if "lat" in result and "latitude" not in result:
-                        result["latitude"] = result.pop("lat")
-                    if "lon" in result and "longitude" not in result:
-                        result["longitude"] = result.pop("lon")
-
-                    return result
+                    return meldingen
 
             except asyncio.TimeoutError:
                 _LOGGER.warning(
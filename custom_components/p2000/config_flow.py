@@ -8,23 +8,39 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_NAME
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.selector import BooleanSelector, IconSelector, SelectSelector
+from homeassistant.helpers.selector import (
+    BooleanSelector,
+    IconSelector,
+    NumberSelector,
+    SelectSelector,
+)
 
 from .const import (
     CONF_CAPCODES,
     CONF_DISCIPLINES,
+    CONF_EXTRA_SOURCES,
     CONF_GEMEENTEN,
     CONF_ICON,
+    CONF_NOTIFY_RATE,
+    CONF_NOTIFY_TARGETS,
     CONF_PRIO1,
     CONF_REGIOS,
+    CONF_SCAN_INTERVAL,
     DEFAULT_ICON,
     DEFAULT_NAME,
+    DEFAULT_NOTIFY_RATE,
+    DEFAULT_SCAN_INTERVAL,
     DOMAIN,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
-TEXT_LIST_OPTIONS = (CONF_CAPCODES, CONF_GEMEENTEN)
+TEXT_LIST_OPTIONS = (
+    CONF_CAPCODES,
+    CONF_GEMEENTEN,
+    CONF_NOTIFY_TARGETS,
+    CONF_EXTRA_SOURCES,
+)
 SELECT_LIST_OPTIONS = (CONF_REGIOS, CONF_DISCIPLINES)
 
 REGIO_OPTIONS = [
@@ -101,12 +117,27 @@ def _to_bool(value: Any) -> bool:
     return bool(value)
 
 
+def _to_positive_int(value: Any, default: int) -> int:
+    """Normalize a numeric config value, falling back to the default."""
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        return default
+    return number if number > 0 else default
+
+
 def _normalize_config(config: dict[str, Any]) -> dict[str, Any]:
     """Normalize imported and UI config data."""
     normalized = dict(config)
     normalized[CONF_NAME] = normalized.get(CONF_NAME) or DEFAULT_NAME
     normalized[CONF_ICON] = normalized.get(CONF_ICON) or DEFAULT_ICON
     normalized[CONF_PRIO1] = _to_bool(normalized.get(CONF_PRIO1, False))
+    normalized[CONF_SCAN_INTERVAL] = _to_positive_int(
+        normalized.get(CONF_SCAN_INTERVAL), DEFAULT_SCAN_INTERVAL
+    )
+    normalized[CONF_NOTIFY_RATE] = _to_positive_int(
+        normalized.get(CONF_NOTIFY_RATE), DEFAULT_NOTIFY_RATE
+    )
 
     for key in TEXT_LIST_OPTIONS:
         normalized[key] = _value_to_list(normalized.get(key))
@@ -152,6 +183,28 @@ def _options_schema(defaults: dict[str, Any] | None = None) -> vol.Schema:
                 CONF_DISCIPLINES, default=defaults[CONF_DISCIPLINES]
             ): _multi_select(DISCIPLINE_OPTIONS),
             vol.Optional(CONF_PRIO1, default=defaults[CONF_PRIO1]): BooleanSelector(),
+            vol.Optional(
+                CONF_SCAN_INTERVAL, default=defaults[CONF_SCAN_INTERVAL]
+            ): NumberSelector(
+                {
+                    "min": 10,
+                    "max": 3600,
+                    "step": 1,
+                    "mode": "box",
+                    "unit_of_measurement": "s",
+                }
+            ),
+            vol.Optional(
+                CONF_NOTIFY_TARGETS, default=_list_to_text(defaults[CONF_NOTIFY_TARGETS])
+            ): cv.string,
+            vol.Optional(
+                CONF_NOTIFY_RATE, default=defaults[CONF_NOTIFY_RATE]
+            ): NumberSelector(
+                {"min": 1, "max": 120, "step": 1, "mode": "box"}
+            ),
+            vol.Optional(
+                CONF_EXTRA_SOURCES, default=_list_to_text(defaults[CONF_EXTRA_SOURCES])
+            ): cv.string,
         }
     )
 
@@ -9,3 +9,15 @@ CONF_CAPCODES = "capcodes"
 CONF_REGIOS = "regios"
 CONF_DISCIPLINES = "disciplines"
 CONF_PRIO1 = "prio1"
+CONF_SCAN_INTERVAL = "scan_interval"
+CONF_EXTRA_SOURCES = "extra_sources"
+CONF_NOTIFY_TARGETS = "notify_targets"
+CONF_NOTIFY_RATE = "notify_rate"
+
+DEFAULT_SCAN_INTERVAL = 30
+DEFAULT_NOTIFY_RATE = 12
+NOTIFY_BURST = 3
+NOTIFY_DEDUPE_WINDOW = 300
+NOTIFY_QUEUE_SIZE = 100
+
+RECENT_MELDINGEN = 200
@@ -1,17 +1,64 @@
 from __future__ import annotations
 
-from datetime import timedelta
+from collections import deque
+from collections.abc import Callable
+from datetime import datetime, timedelta
+import itertools
 import logging
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
+from homeassistant.util import dt as dt_util
+
+from .const import RECENT_MELDINGEN
 
 _LOGGER = logging.getLogger(__name__)
 
+MeldingListener = Callable[[dict[str, Any]], None]
+
+# Shared by all coordinators, so a version is never reused after a reload.
+_RECENT_VERSIONS = itertools.count(1)
+
+
+def _matches_any(value: Any, allowed: list[str]) -> bool:
+    """Return True if a melding value is in a filter list, ignoring case."""
+    if value in (None, ""):
+        return True
+    return str(value).strip().lower() in {str(item).lower() for item in allowed}
+
+
+def melding_matches_filter(melding: dict[str, Any], api_filter: dict[str, Any]) -> bool:
+    """Return True if a cached melding still matches an API filter.
+
+    Fields missing from the melding are not held against it, so only
+    meldingen that clearly fall outside the filter are dropped.
+    """
+    if capcodes := api_filter.get("capcodes"):
+        wanted = {str(capcode).lstrip("0") for capcode in capcodes}
+        found = {
+            str(capcode.get("capcode", "")).lstrip("0")
+            for capcode in melding.get("capcodes") or []
+            if isinstance(capcode, dict)
+        }
+        if found and not found & wanted:
+            return False
+    if gemeenten := api_filter.get("gemeenten"):
+        if not _matches_any(melding.get("gemeente"), gemeenten):
+            return False
+    if regios := api_filter.get("regios"):
+        if not _matches_any(melding.get("regioid"), regios):
+            return False
+    if disciplines := api_filter.get("disciplines"):
+        if not _matches_any(melding.get("dienstid"), disciplines):
+            return False
+    if api_filter.get("prio1") and "prio1" in melding:
+        return str(melding.get("prio1")) == "1"
+    return True
+
 
 class P2000DataUpdateCoordinator(DataUpdateCoordinator):
     """Coordinator to manage fetching P2000 data."""
@@ -22,10 +69,18 @@ class P2000DataUpdateCoordinator(DataUpdateCoordinator):
         api: Any,
         api_filter: dict[str, Any],
         update_interval: int = 30,
+        entry_config: dict[str, Any] | None = None,
     ) -> None:
         """Initialize the update coordinator."""
         self.api = api
         self.api_filter = api_filter
+        self.entry_config: dict[str, Any] = entry_config or {}
+        self.recent: deque[tuple[datetime, dict[str, Any]]] = deque(
+            maxlen=RECENT_MELDINGEN
+        )
+        self.recent_version = next(_RECENT_VERSIONS)
+        self._melding_listeners: list[MeldingListener] = []
+        self._needs_baseline = False
 
         super().__init__(
             hass,
@@ -34,6 +89,51 @@ class P2000DataUpdateCoordinator(DataUpdateCoordinator):
             update_interval=timedelta(seconds=update_interval),
         )
 
+    @callback
+    def async_add_melding_listener(self, listener: MeldingListener) -> CALLBACK_TYPE:
+        """Listen for new meldingen and return a function to stop listening."""
+        self._melding_listeners.append(listener)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the melding listener."""
+            self._melding_listeners.remove(listener)
+
+        return remove_listener
+
+    @callback
+    def async_update_filter(
+        self, api_filter: dict[str, Any], update_interval: int
+    ) -> None:
+        """Apply a new filter and interval without recreating the coordinator."""
+        self.api_filter = api_filter
+        self.update_interval = timedelta(seconds=update_interval)
+        # The known melding may not match the new filter, so the next poll
+        # only fetches the latest melding as a baseline and dispatches nothing.
+        self._needs_baseline = True
+
+        self.recent = deque(
+            (
+                (received, melding)
+                for received, melding in self.recent
+                if melding_matches_filter(melding, api_filter)
+            ),
+            maxlen=RECENT_MELDINGEN,
+        )
+        self.recent_version = next(_RECENT_VERSIONS)
+
+        if self.data and not melding_matches_filter(self.data, api_filter):
+            self.async_set_updated_data({})
+
+    @callback
+    def _async_dispatch_melding(self, melding: dict[str, Any]) -> None:
+        """Hand a new melding to every melding listener."""
+        for listener in list(self._melding_listeners):
+            try:
+                listener(melding)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error in P2000 melding listener")
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from API and handle exceptions."""
         try:
@@ -42,15 +142,30 @@ class P2000DataUpdateCoordinator(DataUpdateCoordinator):
                 self.api_filter,
             )
 
-            result = await self.api.get_data(self.api_filter)
+            baseline = self._needs_baseline
+            known_id = self.data.get("id") if self.data and not baseline else None
+            meldingen = await self.api.get_meldingen(
+                self.api_filter, None if known_id is None else str(known_id)
+            )
 
-            if not result:
+            if not meldingen:
                 _LOGGER.debug("No new P2000 data returned, keeping last known state")
                 return self.data or {}
 
-            return result
-
         except Exception as err:
             raise UpdateFailed(
                 f"P2000 API request failed: {err}"
             ) from err
+
+        if baseline:
+            self._needs_baseline = False
+            return meldingen[0]
+
+        received = dt_util.utcnow()
+        self.recent.extendleft((received, melding) for melding in reversed(meldingen))
+        self.recent_version = next(_RECENT_VERSIONS)
+
+        for melding in reversed(meldingen):
+            self._async_dispatch_melding(melding)
+
+        return meldingen[0]
@@ -7,9 +7,16 @@ from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-from .const import CONF_CAPCODES, CONF_GEMEENTEN, DOMAIN
+from .const import (
+    CONF_CAPCODES,
+    CONF_EXTRA_SOURCES,
+    CONF_GEMEENTEN,
+    CONF_NOTIFY_TARGETS,
+    DOMAIN,
+)
+from .merger import P2000SourceMerger
 
-TO_REDACT = {CONF_CAPCODES, CONF_GEMEENTEN}
+TO_REDACT = {CONF_CAPCODES, CONF_GEMEENTEN, CONF_NOTIFY_TARGETS, CONF_EXTRA_SOURCES}
 
 
 def _redact_data(data: dict[str, Any]) -> dict[str, Any]:
@@ -21,6 +28,15 @@ async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
+    sources: dict[str, Any] = {}
+    coordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if coordinator is not None and isinstance(coordinator.api, P2000SourceMerger):
+        # Source names are URLs, number them instead.
+        sources = {
+            f"source_{index}": stats
+            for index, stats in enumerate(coordinator.api.as_dict().values())
+        }
+
     return {
         "domain": DOMAIN,
         "entry": {
@@ -30,4 +46,5 @@ async def async_get_config_entry_diagnostics(
             "data": _redact_data(dict(entry.data)),
             "options": _redact_data(dict(entry.options)),
         },
+        "sources": sources,
     }
@@ -0,0 +1,184 @@
+"""GeoJSON view of recent P2000 meldingen for map dashboards."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import hashlib
+from http import HTTPStatus
+import json
+import math
+from typing import Any
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .coordinator import P2000DataUpdateCoordinator
+from .helpers import to_float
+
+CACHE_SIZE = 32
+MAX_HOURS = 24 * 365
+
+QueryKey = tuple[tuple[float, float, float, float] | None, str | None, float | None]
+
+
+def _parse_query(query: dict[str, str]) -> QueryKey:
+    """Parse and normalize the bbox, discipline and hours parameters."""
+    bbox = None
+    if raw_bbox := query.get("bbox"):
+        parts = [float(part) for part in raw_bbox.split(",")]
+        if len(parts) != 4 or not all(math.isfinite(part) for part in parts):
+            raise ValueError("bbox needs min_lon,min_lat,max_lon,max_lat")
+        bbox = (parts[0], parts[1], parts[2], parts[3])
+
+    discipline = query.get("discipline")
+    discipline = discipline.strip().lower() if discipline else None
+
+    hours = None
+    if raw_hours := query.get("hours"):
+        hours = float(raw_hours)
+        if not 0 < hours <= MAX_HOURS:
+            raise ValueError(f"hours must be between 0 and {MAX_HOURS}")
+
+    return bbox, discipline, hours
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Return True if an If-None-Match header lists the ETag, weak or strong."""
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+
+def _feature(received: datetime, melding: dict[str, Any]) -> dict[str, Any] | None:
+    """Convert a melding to a GeoJSON point feature."""
+    latitude = to_float(melding.get("latitude"))
+    longitude = to_float(melding.get("longitude"))
+    if latitude is None or longitude is None:
+        return None
+
+    return {
+        "type": "Feature",
+        "id": melding.get("id"),
+        "geometry": {"type": "Point", "coordinates": [longitude, latitude]},
+        "properties": {
+            "melding": melding.get("melding"),
+            "tekstmelding": melding.get("tekstmelding"),
+            "dienst": melding.get("dienst"),
+            "regio": melding.get("regio"),
+            "plaats": melding.get("plaats"),
+            "straat": melding.get("straat"),
+            "datum": melding.get("datum"),
+            "tijd": melding.get("tijd"),
+            "prio1": str(melding.get("prio1")) == "1",
+            "grip": melding.get("grip"),
+            "received": received.isoformat(),
+        },
+    }
+
+
+def build_feature_collection(
+    recent: list[tuple[datetime, dict[str, Any]]],
+    key: QueryKey,
+    now: datetime,
+) -> tuple[bytes, datetime | None]:
+    """Serialize matching meldingen, returning the body and when it goes stale.
+
+    A time window makes the body stale once its oldest melding leaves the
+    window, even when no new meldingen arrive.
+    """
+    bbox, discipline, hours = key
+    since = now - timedelta(hours=hours) if hours else None
+
+    features: list[dict[str, Any]] = []
+    seen: set[str] = set()
+    oldest: datetime | None = None
+    for received, melding in recent:
+        if since is not None and received < since:
+            continue
+        if discipline is not None and discipline not in (
+            str(melding.get("dienstid", "")).lower(),
+            str(melding.get("dienst", "")).lower(),
+        ):
+            continue
+        if (feature := _feature(received, melding)) is None:
+            continue
+        longitude, latitude = feature["geometry"]["coordinates"]
+        if bbox is not None and not (
+            bbox[0] <= longitude <= bbox[2] and bbox[1] <= latitude <= bbox[3]
+        ):
+            continue
+        if str(feature["id"]) in seen:
+            continue
+
+        seen.add(str(feature["id"]))
+        features.append(feature)
+        oldest = received if oldest is None else min(oldest, received)
+
+    body = json.dumps(
+        {"type": "FeatureCollection", "features": features},
+        separators=(",", ":"),
+    ).encode()
+    stale_at = oldest + timedelta(hours=hours) if hours and oldest else None
+    return body, stale_at
+
+
+class P2000GeoJsonView(HomeAssistantView):
+    """Serve recent meldingen of all P2000 entries as GeoJSON.
+
+    Bodies are serialized once per query and reused until new meldingen
+    arrive. Clients sending the ETag back get a 304 without a body.
+    """
+
+    url = "/api/p2000/geojson"
+    name = "api:p2000:geojson"
+    requires_auth = True
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the view."""
+        self.hass = hass
+        self._cache: dict[QueryKey, tuple[Any, datetime | None, bytes, str]] = {}
+
+    def _coordinators(self) -> list[P2000DataUpdateCoordinator]:
+        """Return the coordinators of all loaded entries."""
+        return list(self.hass.data.get(DOMAIN, {}).values())
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return the recent meldingen as a GeoJSON FeatureCollection."""
+        try:
+            key = _parse_query(request.query)
+        except ValueError as err:
+            return self.json_message(str(err), HTTPStatus.BAD_REQUEST)
+
+        coordinators = self._coordinators()
+        version = tuple(coordinator.recent_version for coordinator in coordinators)
+        now = dt_util.utcnow()
+
+        cached = self._cache.get(key)
+        if (
+            cached is None
+            or cached[0] != version
+            or (cached[1] is not None and cached[1] <= now)
+        ):
+            recent = sorted(
+                (item for coordinator in coordinators for item in coordinator.recent),
+                key=lambda item: item[0],
+                reverse=True,
+            )
+            body, stale_at = build_feature_collection(recent, key, now)
+            etag = f'"{hashlib.sha1(body, usedforsecurity=False).hexdigest()}"'
+            if len(self._cache) >= CACHE_SIZE:
+                self._cache.clear()
+            cached = self._cache[key] = (version, stale_at, body, etag)
+
+        _, _, body, etag = cached
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if _etag_matches(request.headers.get("If-None-Match"), etag):
+            return web.Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
+
+        return web.Response(
+            body=body, content_type="application/geo+json", headers=headers
+        )
@@ -0,0 +1,16 @@
+"""Helpers shared by the P2000 modules."""
+from __future__ import annotations
+
+from typing import Any
+
+
+def to_float(value: Any) -> float | None:
+    """Convert API coordinates to floats, accepting comma decimals."""
+    if value in (None, ""):
+        return None
+    if isinstance(value, str):
+        value = value.strip().replace(",", ".")
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
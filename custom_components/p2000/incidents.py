@@ -0,0 +1,229 @@
+"""Group related P2000 meldingen into incidents."""
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+import itertools
+import math
+import time
+from typing import Any
+
+from .helpers import to_float
+
+INCIDENT_WINDOW = 900
+INCIDENT_RADIUS = 500
+CELL_SIZE = 0.01
+
+EARTH_RADIUS = 6371000
+
+
+def _to_grip(value: Any) -> int:
+    """Return the GRIP level of a melding, 0 when there is none."""
+    try:
+        return max(0, int(value))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Return the distance in meters between two coordinates."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = (
+        math.sin(dphi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS * math.asin(math.sqrt(a))
+
+
+def _cell(latitude: float, longitude: float) -> tuple[int, int]:
+    """Return the grid cell containing a coordinate."""
+    return math.floor(latitude / CELL_SIZE), math.floor(longitude / CELL_SIZE)
+
+
+def _address_key(melding: dict[str, Any]) -> str | None:
+    """Return a normalized street and place key."""
+    straat = " ".join(str(melding.get("straat") or "").lower().split())
+    if not straat:
+        return None
+    plaats = " ".join(str(melding.get("plaats") or "").lower().split())
+    return f"{straat}|{plaats}"
+
+
+def _grip_key(melding: dict[str, Any]) -> str | None:
+    """Return the region key for a melding with a GRIP level."""
+    if not _to_grip(melding.get("grip")):
+        return None
+    return f"grip|{melding.get('regio')}"
+
+
+@dataclass
+class Incident:
+    """A group of meldingen belonging to the same incident."""
+
+    id: str
+    melding_id: Any
+    first_seen: float
+    last_seen: float
+    melding: dict[str, Any]
+    latitude: float | None = None
+    longitude: float | None = None
+    member_count: int = 1
+    escalation_level: int = 0
+    capcodes: set[str] = field(default_factory=set)
+    index_keys: set[str] = field(default_factory=set)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the incident as state attributes."""
+        return {
+            "incident_id": self.id,
+            "melding_id": self.melding_id,
+            "member_count": self.member_count,
+            "escalation_level": self.escalation_level,
+            "melding": self.melding.get("melding"),
+            "plaats": self.melding.get("plaats"),
+            "straat": self.melding.get("straat"),
+            "latitude": self.latitude,
+            "longitude": self.longitude,
+            "capcodes": sorted(self.capcodes),
+        }
+
+
+class IncidentClusterer:
+    """Assign meldingen to incidents using indexes over recent incidents.
+
+    Incidents are looked up by address, by the active GRIP incident per
+    region and by a coordinate grid, so assigning a melding only inspects a
+    handful of candidates. Incidents without new meldingen for `window`
+    seconds expire.
+
+    Incidents get their own ids, because melding ids may be missing or
+    repeat across sources.
+    """
+
+    def __init__(
+        self,
+        window: float = INCIDENT_WINDOW,
+        radius: float = INCIDENT_RADIUS,
+    ) -> None:
+        """Initialize the clusterer."""
+        self.window = window
+        self.radius = radius
+        self._incidents: dict[str, Incident] = {}
+        self._ids = itertools.count(1)
+        self._expiry: deque[tuple[float, str]] = deque()
+        self._by_address: dict[str, str] = {}
+        self._by_grip: dict[str, str] = {}
+        self._by_cell: dict[tuple[int, int], set[str]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of active incidents."""
+        return len(self._incidents)
+
+    def _expire(self, now: float) -> None:
+        """Drop incidents that have been quiet for longer than the window."""
+        while self._expiry and self._expiry[0][0] <= now:
+            _, incident_id = self._expiry.popleft()
+            incident = self._incidents.get(incident_id)
+            if incident is None or incident.last_seen + self.window > now:
+                continue
+
+            del self._incidents[incident_id]
+            for index in (self._by_address, self._by_grip):
+                for key in incident.index_keys:
+                    if index.get(key) == incident_id:
+                        del index[key]
+            if incident.latitude is not None and incident.longitude is not None:
+                cell = _cell(incident.latitude, incident.longitude)
+                self._by_cell[cell].discard(incident_id)
+                if not self._by_cell[cell]:
+                    del self._by_cell[cell]
+
+    def _find_nearby(self, latitude: float, longitude: float) -> Incident | None:
+        """Return the closest incident within the radius."""
+        row, col = _cell(latitude, longitude)
+        best: Incident | None = None
+        best_distance = self.radius
+        for cell in (
+            (row + drow, col + dcol) for drow in (-1, 0, 1) for dcol in (-1, 0, 1)
+        ):
+            for incident_id in self._by_cell.get(cell, ()):
+                incident = self._incidents[incident_id]
+                distance = _distance(
+                    latitude, longitude, incident.latitude, incident.longitude
+                )
+                if distance <= best_distance:
+                    best, best_distance = incident, distance
+        return best
+
+    def _find_grip_incident(
+        self, grip: str, melding: dict[str, Any], address: str | None
+    ) -> Incident | None:
+        """Return the active GRIP incident in the region this melding belongs to.
+
+        A change of GRIP level is an escalation of that incident. A page at
+        the same level only joins it when it has no address of its own, so
+        unrelated GRIP incidents in one region stay apart.
+        """
+        incident = self._incidents.get(self._by_grip.get(grip, ""))
+        if incident is None:
+            return None
+        if _to_grip(melding.get("grip")) != incident.escalation_level or not address:
+            return incident
+        return None
+
+    def add(
+        self, melding: dict[str, Any], now: float | None = None
+    ) -> tuple[Incident, bool]:
+        """Assign a melding to an incident, returning it and whether it is new."""
+        now = time.monotonic() if now is None else now
+        self._expire(now)
+
+        address = _address_key(melding)
+        grip = _grip_key(melding)
+        latitude = to_float(melding.get("latitude"))
+        longitude = to_float(melding.get("longitude"))
+        has_location = latitude is not None and longitude is not None
+
+        incident = self._incidents.get(self._by_address.get(address, ""))
+        if incident is None and grip:
+            incident = self._find_grip_incident(grip, melding, address)
+        if incident is None and has_location:
+            incident = self._find_nearby(latitude, longitude)
+
+        created = incident is None
+        if incident is None:
+            incident = Incident(
+                id=str(next(self._ids)),
+                melding_id=melding.get("id"),
+                first_seen=now,
+                last_seen=now,
+                melding=melding,
+            )
+            self._incidents[incident.id] = incident
+        else:
+            incident.member_count += 1
+            incident.last_seen = now
+            incident.melding = melding
+
+        incident.escalation_level = max(
+            incident.escalation_level, _to_grip(melding.get("grip"))
+        )
+        incident.capcodes.update(
+            str(capcode.get("capcode"))
+            for capcode in melding.get("capcodes") or []
+            if isinstance(capcode, dict) and capcode.get("capcode")
+        )
+        if has_location and incident.latitude is None:
+            incident.latitude, incident.longitude = latitude, longitude
+            self._by_cell.setdefault(_cell(latitude, longitude), set()).add(incident.id)
+        if address:
+            self._by_address[address] = incident.id
+            incident.index_keys.add(address)
+        if grip:
+            self._by_grip[grip] = incident.id
+            incident.index_keys.add(grip)
+
+        self._expiry.append((now + self.window, incident.id))
+        return incident, created
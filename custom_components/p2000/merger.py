@@ -0,0 +1,184 @@
+"""Merge meldingen from several P2000 sources."""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from datetime import datetime
+import hashlib
+import logging
+import time
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+SEEN_TTL = 600
+SEEN_MAX = 5000
+GRACE_PERIOD = 2
+TIMESTAMP_FORMATS = ("%d-%m-%y %H:%M:%S", "%d-%m-%Y %H:%M:%S", "%Y-%m-%d %H:%M:%S")
+
+
+def content_hash(melding: dict[str, Any]) -> str:
+    """Return a hash of the capcodes, text and timestamp of a melding.
+
+    Sources use their own ids, so copies of one melding are matched on
+    content instead.
+    """
+    capcodes = sorted(
+        str(capcode.get("capcode", "")).lstrip("0")
+        for capcode in melding.get("capcodes") or []
+        if isinstance(capcode, dict)
+    )
+    text = " ".join(
+        str(melding.get("tekstmelding") or melding.get("melding") or "").lower().split()
+    )
+    timestamp = f"{melding.get('datum') or ''} {melding.get('tijd') or ''}".strip()
+    content = "\x1f".join((",".join(capcodes), text, timestamp))
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+
+def melding_timestamp(melding: dict[str, Any], default: float) -> float:
+    """Return the local datum and tijd of a melding as a timestamp."""
+    value = f"{melding.get('datum') or ''} {melding.get('tijd') or ''}".strip()
+    for timestamp_format in TIMESTAMP_FORMATS:
+        try:
+            parsed = datetime.strptime(value, timestamp_format)
+        except ValueError:
+            continue
+        return dt_util.as_utc(parsed).timestamp()
+    return default
+
+
+@dataclass
+class SourceStats:
+    """Latency statistics for a single source."""
+
+    requests: int = 0
+    fetch_time: float | None = None
+    first: int = 0
+    duplicates: int = 0
+    lag: float | None = None
+
+
+def _average(current: float | None, value: float) -> float:
+    """Return an exponential moving average."""
+    if current is not None:
+        value = current * 0.8 + value * 0.2
+    return round(value, 3)
+
+
+class P2000SourceMerger:
+    """Poll several sources concurrently and deliver each melding once.
+
+    Meldingen are deduplicated on their content hash. The copy that arrives
+    first is delivered, and later copies only update the latency statistics.
+    A poll waits for the first source plus a short grace period. Slower
+    sources keep running, and their results are merged into the next poll
+    unless the filter changed in the meantime.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, entry: ConfigEntry, sources: dict[str, Any]
+    ) -> None:
+        """Initialize the merger with named API clients."""
+        self.hass = hass
+        self.entry = entry
+        self.sources = sources
+        self.stats = {name: SourceStats() for name in sources}
+        self._known_ids: dict[str, str] = {}
+        self._seen: OrderedDict[str, tuple[float, str, float]] = OrderedDict()
+        self._pending: dict[str, tuple[dict[str, Any], asyncio.Task]] = {}
+
+    def _is_new(self, digest: str, source: str, now: float) -> bool:
+        """Record a content hash, returning False for a copy seen before."""
+        while self._seen and (
+            len(self._seen) > SEEN_MAX or next(iter(self._seen.values()))[0] <= now
+        ):
+            self._seen.popitem(last=False)
+
+        if (seen := self._seen.get(digest)) is not None:
+            stats = self.stats[source]
+            stats.duplicates += 1
+            if seen[1] != source:
+                stats.lag = _average(stats.lag, now - seen[2])
+            return False
+
+        self._seen[digest] = (now + SEEN_TTL, source, now)
+        self.stats[source].first += 1
+        return True
+
+    async def _async_fetch(
+        self, name: str, api: Any, api_filter: dict[str, Any]
+    ) -> tuple[str, float, float, list[dict[str, Any]]]:
+        """Fetch one source, returning its name, arrival times and meldingen."""
+        started = time.monotonic()
+        meldingen = await api.get_meldingen(api_filter, self._known_ids.get(name))
+        arrived = time.monotonic()
+
+        stats = self.stats[name]
+        stats.requests += 1
+        stats.fetch_time = _average(stats.fetch_time, arrived - started)
+        return name, arrived, time.time(), meldingen or []
+
+    async def get_meldingen(
+        self,
+        api_filter: dict[str, Any],
+        known_id: str | None = None,
+    ) -> list[dict[str, Any]] | None:
+        """Fetch new meldingen from all sources, newest first."""
+        if known_id is None:
+            self._known_ids.clear()
+
+        for name, (task_filter, task) in list(self._pending.items()):
+            if task_filter != api_filter:
+                task.cancel()
+                del self._pending[name]
+
+        for name, api in self.sources.items():
+            if name not in self._pending:
+                self._pending[name] = (
+                    api_filter,
+                    self.entry.async_create_background_task(
+                        self.hass,
+                        self._async_fetch(name, api, api_filter),
+                        f"p2000 fetch {name}",
+                    ),
+                )
+
+        tasks = [task for _, task in self._pending.values()]
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        if running := [task for task in tasks if not task.done()]:
+            await asyncio.wait(running, timeout=GRACE_PERIOD)
+
+        results: list[tuple[str, float, float, list[dict[str, Any]]]] = []
+        for name, (_, task) in list(self._pending.items()):
+            if not task.done():
+                continue
+            del self._pending[name]
+            try:
+                results.append(task.result())
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.warning("P2000 source %s failed: %s", name, err)
+
+        meldingen: list[tuple[float, dict[str, Any]]] = []
+        for name, arrived, received, batch in sorted(
+            results, key=lambda result: result[1]
+        ):
+            if batch:
+                self._known_ids[name] = str(batch[0].get("id"))
+            meldingen.extend(
+                (melding_timestamp(melding, received), melding)
+                for melding in batch
+                if self._is_new(content_hash(melding), name, arrived)
+            )
+
+        meldingen.sort(key=lambda item: item[0], reverse=True)
+        return [melding for _, melding in meldingen] or None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the per-source statistics."""
+        return {name: asdict(stats) for name, stats in self.stats.items()}
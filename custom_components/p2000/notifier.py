@@ -0,0 +1,190 @@
+"""Rate-limited notification delivery for new P2000 meldingen."""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+import logging
+import time
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import NOTIFY_BURST, NOTIFY_DEDUPE_WINDOW, NOTIFY_QUEUE_SIZE
+
+_LOGGER = logging.getLogger(__name__)
+
+NOTIFY_DOMAIN = "notify"
+
+
+class TokenBucket:
+    """Token bucket allowing short bursts on top of a sustained rate."""
+
+    def __init__(self, rate: float, capacity: int, now: float | None = None) -> None:
+        """Initialize a full bucket refilling `rate` tokens per second."""
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic() if now is None else now
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last update."""
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def consume(self, now: float | None = None) -> bool:
+        """Take a token if one is available."""
+        self._refill(time.monotonic() if now is None else now)
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def time_until_token(self, now: float | None = None) -> float:
+        """Return the seconds until a token is available."""
+        self._refill(time.monotonic() if now is None else now)
+        if self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+
+def _dedupe_key(melding: dict[str, Any]) -> str:
+    """Return the key shared by repeated pages of one incident."""
+    text = melding.get("melding") or melding.get("tekstmelding") or ""
+    key = " ".join(str(text).lower().split())
+    return key or str(melding.get("id"))
+
+
+def _melding_text(melding: dict[str, Any]) -> str:
+    """Return a single line describing a melding."""
+    text = melding.get("tekstmelding") or melding.get("melding") or ""
+    plaats = melding.get("plaats")
+    if plaats and plaats not in text:
+        text = f"{text} ({plaats})"
+    return text
+
+
+def _build_message(meldingen: list[dict[str, Any]]) -> dict[str, str]:
+    """Build notify service data for one melding or a digest of several."""
+    if len(meldingen) == 1:
+        melding = meldingen[0]
+        return {
+            "title": f"P2000 {melding.get('dienst') or ''}".strip(),
+            "message": _melding_text(melding),
+        }
+
+    return {
+        "title": f"P2000: {len(meldingen)} meldingen",
+        "message": "\n".join(
+            f"{melding.get('tijd') or ''} {_melding_text(melding)}".strip()
+            for melding in meldingen
+        ),
+    }
+
+
+def _notify_service(target: str) -> str:
+    """Strip an optional notify domain from a target."""
+    domain, _, service = target.partition(".")
+    return service if domain == NOTIFY_DOMAIN and service else target
+
+
+class _NotifyTarget:
+    """Queue and rate limit state for a single notify service."""
+
+    def __init__(self, service: str, rate: float) -> None:
+        """Initialize the target."""
+        self.service = service
+        self.bucket = TokenBucket(rate, NOTIFY_BURST)
+        self.queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(NOTIFY_QUEUE_SIZE)
+
+
+class P2000Notifier:
+    """Deliver new meldingen to notify services without blocking the coordinator."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        targets: list[str],
+        rate_per_hour: int,
+    ) -> None:
+        """Initialize the notifier."""
+        self.hass = hass
+        rate = rate_per_hour / 3600
+        self._targets = [
+            _NotifyTarget(_notify_service(target), rate) for target in targets
+        ]
+        self._seen: OrderedDict[str, float] = OrderedDict()
+
+    @callback
+    def async_start(self, entry: ConfigEntry) -> None:
+        """Start a delivery task per target, stopped when the entry unloads."""
+        for target in self._targets:
+            entry.async_create_background_task(
+                self.hass,
+                self._async_run(target),
+                f"p2000 notify {target.service}",
+            )
+
+    def _is_duplicate(self, melding: dict[str, Any], now: float) -> bool:
+        """Return True for a repeated page of a recently notified incident."""
+        while self._seen and next(iter(self._seen.values())) <= now:
+            self._seen.popitem(last=False)
+
+        key = _dedupe_key(melding)
+        if key in self._seen:
+            return True
+        self._seen[key] = now + NOTIFY_DEDUPE_WINDOW
+        return False
+
+    @callback
+    def async_handle_melding(self, melding: dict[str, Any]) -> None:
+        """Queue a new melding for every target."""
+        if self._is_duplicate(melding, time.monotonic()):
+            _LOGGER.debug("Skipping duplicate P2000 page: %s", melding.get("id"))
+            return
+
+        for target in self._targets:
+            try:
+                target.queue.put_nowait(melding)
+            except asyncio.QueueFull:
+                _LOGGER.warning(
+                    "Notification queue for %s is full, dropping melding %s",
+                    target.service,
+                    melding.get("id"),
+                )
+
+    async def _async_run(self, target: _NotifyTarget) -> None:
+        """Send queued meldingen, collapsing them into a digest while throttled."""
+        while True:
+            pending = [await target.queue.get()]
+
+            while not target.bucket.consume():
+                try:
+                    pending.append(
+                        await asyncio.wait_for(
+                            target.queue.get(), target.bucket.time_until_token()
+                        )
+                    )
+                except asyncio.TimeoutError:
+                    pass
+
+            while not target.queue.empty():
+                pending.append(target.queue.get_nowait())
+
+            await self._async_send(target.service, pending)
+
+    async def _async_send(self, service: str, meldingen: list[dict[str, Any]]) -> None:
+        """Call the notify service."""
+        try:
+            await self.hass.services.async_call(
+                NOTIFY_DOMAIN,
+                service,
+                _build_message(meldingen),
+                blocking=True,
+            )
+        except HomeAssistantError as err:
+            _LOGGER.warning("Failed to send P2000 notification to %s: %s", service, err)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error sending P2000 notification to %s", service)
@@ -1,20 +1,28 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
+from datetime import datetime, timedelta
 import logging
 from typing import Any, Dict
 
 import voluptuous as vol
 from homeassistant import config_entries
-from homeassistant.components.sensor import PLATFORM_SCHEMA, SensorEntity
+from homeassistant.components.sensor import (
+    PLATFORM_SCHEMA,
+    SensorEntity,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import (
+    async_track_time_interval,
+    async_track_utc_time_change,
+)
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .api import P2000Api
 from .coordinator import P2000DataUpdateCoordinator
 from .const import (
     CONF_CAPCODES,
@@ -27,6 +35,9 @@ from .const import (
     DEFAULT_NAME,
     DOMAIN,
 )
+from .helpers import to_float
+from .incidents import Incident, IncidentClusterer
+from .stats import SlidingWindowCounter, hourly_statistics
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -43,18 +54,6 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
 )
 
 
-def _to_float(value: Any) -> float | None:
-    """Convert API coordinates to floats, accepting comma decimals."""
-    if value in (None, ""):
-        return None
-    if isinstance(value, str):
-        value = value.strip().replace(",", ".")
-    try:
-        return float(value)
-    except (TypeError, ValueError):
-        return None
-
-
 async def async_setup_platform(
     hass: HomeAssistant,
     config: Dict[str, Any],
@@ -77,38 +76,29 @@ async def async_setup_entry(
 ) -> None:
     """Set up P2000 sensor from a config entry."""
     config = {**entry.data, **entry.options}
+    coordinator: P2000DataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    api_filter: Dict[str, Any] = {}
-    if config.get(CONF_GEMEENTEN):
-        api_filter["gemeenten"] = config[CONF_GEMEENTEN]
-    if config.get(CONF_CAPCODES):
-        api_filter["capcodes"] = config[CONF_CAPCODES]
-    if config.get(CONF_REGIOS):
-        api_filter["regios"] = config[CONF_REGIOS]
-    if config.get(CONF_DISCIPLINES):
-        api_filter["disciplines"] = config[CONF_DISCIPLINES]
-    if config.get(CONF_PRIO1):
-        api_filter["prio1"] = True
-
-    _LOGGER.info("P2000 filter being used: %s", api_filter)
-    session = async_get_clientsession(hass)
-    api = P2000Api(session)
-    coordinator = P2000DataUpdateCoordinator(
-        hass=hass,
-        api=api,
-        api_filter=api_filter,
-        update_interval=30,
-    )
-
-    await coordinator.async_config_entry_first_refresh()
+    name = config.get(CONF_NAME, DEFAULT_NAME)
 
     async_add_entities([
         P2000Sensor(
             coordinator,
             entry.entry_id,
-            config.get(CONF_NAME, DEFAULT_NAME),
+            name,
             config.get(CONF_ICON, DEFAULT_ICON),
-        )
+        ),
+        P2000HourlySensor(coordinator, entry.entry_id, name),
+        P2000StatisticsSensor(
+            coordinator,
+            entry.entry_id,
+            name,
+            "prio1_24_uur",
+            "prio 1 meldingen 24 uur",
+            window=86400,
+            buckets=96,
+            melding_keys=_prio1_keys,
+        ),
+        P2000IncidentSensor(coordinator, entry.entry_id, name),
     ])
 
 
@@ -164,7 +154,204 @@ class P2000Sensor(CoordinatorEntity, SensorEntity):
             for c in capcodes
         )
 
-        attrs["latitude"] = _to_float(data.get("latitude"))
-        attrs["longitude"] = _to_float(data.get("longitude"))
+        attrs["latitude"] = to_float(data.get("latitude"))
+        attrs["longitude"] = to_float(data.get("longitude"))
 
         return attrs
+
+
+def _dienst_regio_keys(melding: Dict[str, Any]) -> Iterable[str]:
+    """Count every melding per discipline and region."""
+    return (
+        f"dienst:{melding.get('dienst') or 'Onbekend'}",
+        f"regio:{melding.get('regio') or 'Onbekend'}",
+    )
+
+
+def _prio1_keys(melding: Dict[str, Any]) -> Iterable[str] | None:
+    """Count only prio 1 meldingen."""
+    if str(melding.get("prio1")) != "1":
+        return None
+    return ()
+
+
+class P2000StatisticsSensor(SensorEntity):
+    """Sensor counting new meldingen over a sliding window.
+
+    `melding_keys` returns the keys a melding is counted under, or None to
+    skip it. Counts are updated for every new melding, but the state is only
+    written once per bucket so the recorder and long-term statistics are not
+    hit on every alarm.
+    """
+
+    _attr_should_poll = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = "meldingen"
+    _attr_icon = "mdi:chart-line"
+
+    def __init__(
+        self,
+        coordinator: P2000DataUpdateCoordinator,
+        entry_id: str,
+        name: str,
+        key: str,
+        label: str,
+        window: float,
+        buckets: int,
+        melding_keys: Callable[[Dict[str, Any]], Iterable[str] | None],
+    ) -> None:
+        """Initialize the statistics sensor."""
+        self.coordinator = coordinator
+        self.counter = SlidingWindowCounter(window, buckets)
+        self._melding_keys = melding_keys
+
+        self._attr_name = f"{name} {label}"
+        self._attr_unique_id = f"p2000_{entry_id}_{key}"
+
+    async def async_added_to_hass(self) -> None:
+        """Start counting meldingen and writing the state per bucket."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_melding_listener(self._async_handle_melding)
+        )
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass,
+                self._async_write_counts,
+                timedelta(seconds=self.counter.bucket_width),
+            )
+        )
+
+    @callback
+    def _async_handle_melding(self, melding: Dict[str, Any]) -> None:
+        """Count a new melding."""
+        if (keys := self._melding_keys(melding)) is not None:
+            self.counter.add(keys)
+
+    @callback
+    def _async_write_counts(self, _now: datetime) -> None:
+        """Write the current window counts."""
+        self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of meldingen in the window."""
+        return self.counter.total()
+
+
+class P2000HourlySensor(P2000StatisticsSensor):
+    """Meldingen in the last hour.
+
+    The counts per discipline and region are published every hour as
+    external long-term statistics instead of as state attributes.
+    """
+
+    def __init__(
+        self,
+        coordinator: P2000DataUpdateCoordinator,
+        entry_id: str,
+        name: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(
+            coordinator,
+            entry_id,
+            name,
+            "meldingen_per_uur",
+            "meldingen per uur",
+            window=3600,
+            buckets=60,
+            melding_keys=_dienst_regio_keys,
+        )
+        self._entry_id = entry_id
+        self._statistics_name = name
+        self._statistic_keys: set[str] = set()
+
+    async def async_added_to_hass(self) -> None:
+        """Also publish the hourly statistics at the start of every hour."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_track_utc_time_change(
+                self.hass, self._async_publish_statistics, minute=0, second=0
+            )
+        )
+
+    @callback
+    def _async_publish_statistics(self, now: datetime) -> None:
+        """Publish the counts of the past hour per discipline and region."""
+        counts = self.counter.counts()
+        self._statistic_keys.update(counts)
+        if "recorder" not in self.hass.config.components or not self._statistic_keys:
+            return
+
+        # pylint: disable-next=import-outside-toplevel
+        from homeassistant.components.recorder.statistics import (
+            async_add_external_statistics,
+        )
+
+        start = now.replace(minute=0, second=0, microsecond=0) - timedelta(hours=1)
+        for metadata, data in hourly_statistics(
+            self._entry_id,
+            self._statistics_name,
+            counts,
+            self._statistic_keys,
+            start,
+        ):
+            async_add_external_statistics(self.hass, metadata, data)
+
+
+class P2000IncidentSensor(SensorEntity):
+    """The latest incident, grouping related meldingen.
+
+    The state only changes when a melding starts a new incident. Follow-up
+    pages and escalations update the attributes of the current incident.
+    """
+
+    _attr_should_poll = False
+    _attr_icon = "mdi:alarm-light"
+
+    def __init__(
+        self,
+        coordinator: P2000DataUpdateCoordinator,
+        entry_id: str,
+        name: str,
+    ) -> None:
+        """Initialize the incident sensor."""
+        self.coordinator = coordinator
+        self.clusterer = IncidentClusterer()
+        self._incident: Incident | None = None
+
+        self._attr_name = f"{name} incident"
+        self._attr_unique_id = f"p2000_{entry_id}_incident"
+
+    async def async_added_to_hass(self) -> None:
+        """Start clustering new meldingen."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_melding_listener(self._async_handle_melding)
+        )
+
+    @callback
+    def _async_handle_melding(self, melding: Dict[str, Any]) -> None:
+        """Assign a new melding to an incident."""
+        incident, created = self.clusterer.add(melding)
+        if created or incident is self._incident:
+            self._incident = incident
+            self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> str | None:
+        """Return the id of the latest incident."""
+        if self._incident is None:
+            return None
+        return self._incident.id
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        """Return the incident details."""
+        if self._incident is None:
+            return {}
+        return {
+            **self._incident.as_dict(),
+            "active_incidents": len(self.clusterer),
+        }
@@ -0,0 +1,104 @@
+"""Sliding window counters for P2000 alarm statistics."""
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+from datetime import datetime
+import time
+from typing import Any
+
+from homeassistant.util import slugify
+
+from .const import DOMAIN
+
+
+class SlidingWindowCounter:
+    """Count events over a sliding window using a fixed ring of buckets.
+
+    Adding an event is constant time and memory is bounded by the number of
+    buckets and distinct keys, regardless of how many events arrive.
+    """
+
+    def __init__(self, window: float, buckets: int, now: float | None = None) -> None:
+        """Initialize a counter covering `window` seconds."""
+        self.bucket_width = window / buckets
+        self._buckets: list[Counter[str]] = [Counter() for _ in range(buckets)]
+        self._totals: list[int] = [0] * buckets
+        self._counts: Counter[str] = Counter()
+        self._total = 0
+        self._index = self._bucket_index(time.monotonic() if now is None else now)
+
+    def _bucket_index(self, now: float) -> int:
+        """Return the absolute bucket index for a timestamp."""
+        return int(now // self.bucket_width)
+
+    def _advance(self, now: float) -> None:
+        """Expire the buckets that fell out of the window."""
+        index = self._bucket_index(now)
+        if index <= self._index:
+            return
+
+        size = len(self._buckets)
+        for expired in range(self._index + 1, min(index, self._index + size) + 1):
+            slot = expired % size
+            self._counts.subtract(self._buckets[slot])
+            self._total -= self._totals[slot]
+            self._buckets[slot].clear()
+            self._totals[slot] = 0
+
+        self._counts = +self._counts
+        self._index = index
+
+    def add(self, keys: Iterable[str] = (), now: float | None = None) -> None:
+        """Record one event, counted once in the total and once per key."""
+        self._advance(time.monotonic() if now is None else now)
+        slot = self._index % len(self._buckets)
+        self._total += 1
+        self._totals[slot] += 1
+        for key in keys:
+            self._buckets[slot][key] += 1
+            self._counts[key] += 1
+
+    def total(self, now: float | None = None) -> int:
+        """Return the number of events inside the window."""
+        self._advance(time.monotonic() if now is None else now)
+        return self._total
+
+    def counts(self, now: float | None = None) -> dict[str, int]:
+        """Return the per-key event counts inside the window."""
+        self._advance(time.monotonic() if now is None else now)
+        return dict(self._counts)
+
+
+def statistic_id(entry_id: str, key: str) -> str:
+    """Return the external statistic id for a counter key."""
+    return f"{DOMAIN}:{slugify(f'{entry_id}_{key}')}"
+
+
+def hourly_statistics(
+    entry_id: str,
+    name: str,
+    counts: dict[str, int],
+    keys: Iterable[str],
+    start: datetime,
+) -> list[tuple[dict[str, Any], list[dict[str, Any]]]]:
+    """Return external statistics metadata and data for one hour of counts.
+
+    Keys without meldingen in this hour are published as zero, so every
+    series has a value for each hour once it has been seen.
+    """
+    statistics = []
+    for key in sorted(keys):
+        group, _, value = key.partition(":")
+        count = counts.get(key, 0)
+        metadata = {
+            "has_mean": True,
+            "has_sum": False,
+            "name": f"{name} meldingen per uur {group} {value}",
+            "source": DOMAIN,
+            "statistic_id": statistic_id(entry_id, key),
+            "unit_of_measurement": "meldingen",
+        }
+        data = [{"start": start, "mean": count, "min": count, "max": count}]
+        statistics.append((metadata, data))
+    return statistics
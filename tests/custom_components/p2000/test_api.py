@@ -0,0 +1,136 @@
+"""Tests for the P2000 API response parsing."""
+
+import json
+import threading
+
+import pytest
+
+from custom_components.p2000 import api
+from custom_components.p2000.api import P2000Api, ResponseTooLarge, parse_meldingen
+
+BODY = json.dumps(
+    {
+        "status": "ok",
+        "meta": {"count": 3, "tags": ["a", "b"]},
+        "meldingen": [
+            {"id": 3, "melding": "Derde", "lat": "52,1", "lon": "6,1"},
+            {"id": 2, "melding": "Tweede"},
+            {"id": 1, "melding": "Eerste"},
+        ],
+    },
+    indent=1,
+).encode()
+
+
+class FakeContent:
+    """Response stream yielding a body in chunks."""
+
+    def __init__(self, body, chunk_size=4):
+        """Initialize the stream."""
+        self.body = body
+        self.chunk_size = chunk_size
+        self.read = 0
+
+    async def iter_chunked(self, size):
+        """Yield the body in small chunks."""
+        for start in range(0, len(self.body), self.chunk_size):
+            chunk = self.body[start : start + self.chunk_size]
+            self.read += len(chunk)
+            yield chunk
+
+
+class FakeResponse:
+    """Minimal aiohttp response."""
+
+    def __init__(self, body, content_length=None):
+        """Initialize the response."""
+        self.status = 200
+        self.charset = "utf-8"
+        self.content_length = content_length
+        self.content = FakeContent(body)
+
+    async def __aenter__(self):
+        """Enter the response context."""
+        return self
+
+    async def __aexit__(self, *args):
+        """Leave the response context."""
+
+
+class FakeSession:
+    """Session returning a fixed response and recording request headers."""
+
+    def __init__(self, response):
+        """Initialize the session."""
+        self.response = response
+        self.headers = None
+
+    def get(self, url, **kwargs):
+        """Return the response."""
+        self.headers = kwargs.get("headers")
+        return self.response
+
+
+def test_parse_meldingen_stops_at_known_melding() -> None:
+    """Test only meldingen newer than the known id are parsed."""
+    meldingen = parse_meldingen(BODY, "utf-8", "1")
+
+    assert [melding["id"] for melding in meldingen] == [3, 2]
+    assert meldingen[0]["latitude"] == "52,1"
+    assert meldingen[0]["longitude"] == "6,1"
+    assert parse_meldingen(BODY, "utf-8", 3) == []
+
+
+def test_parse_meldingen_returns_latest_without_known_melding() -> None:
+    """Test only the latest melding is returned on the first fetch."""
+    assert [melding["id"] for melding in parse_meldingen(BODY, "utf-8")] == [3]
+
+
+def test_parse_meldingen_handles_missing_and_invalid_data() -> None:
+    """Test empty responses and invalid JSON."""
+    assert parse_meldingen(b'{"meldingen": []}', "utf-8") == []
+    assert parse_meldingen(b'{"meldingen": null}', "utf-8") == []
+    assert parse_meldingen(b"{}", "utf-8") == []
+
+    with pytest.raises(ValueError):
+        parse_meldingen(b"<html>", "utf-8")
+    with pytest.raises(ValueError):
+        parse_meldingen(b'{"meldingen": [{"id": 1} {"id": 2}]}', "utf-8", "5")
+
+
+async def test_read_body_rejects_oversized_responses(monkeypatch) -> None:
+    """Test the size cap applies to declared and streamed bodies."""
+    monkeypatch.setattr(api, "MAX_RESPONSE_SIZE", 10)
+    client = P2000Api(FakeSession(None))
+
+    declared = FakeResponse(b"{}", content_length=11)
+    with pytest.raises(ResponseTooLarge):
+        await client._read_body(declared)
+    assert declared.content.read == 0
+
+    streamed = FakeResponse(b"x" * 100)
+    with pytest.raises(ResponseTooLarge):
+        await client._read_body(streamed)
+    assert streamed.content.read < 100
+
+    assert await client._read_body(FakeResponse(b"0123456789")) == b"0123456789"
+
+
+async def test_get_meldingen_parses_large_bodies_in_executor(monkeypatch) -> None:
+    """Test bodies above the threshold are parsed outside the event loop."""
+    threads = []
+
+    def parse(body, encoding, known_id=None):
+        """Record the thread parsing the body."""
+        threads.append(threading.get_ident())
+        return parse_meldingen(body, encoding, known_id)
+
+    monkeypatch.setattr(api, "parse_meldingen", parse)
+    monkeypatch.setattr(api, "EXECUTOR_PARSE_SIZE", 0)
+    session = FakeSession(FakeResponse(BODY, content_length=len(BODY)))
+
+    meldingen = await P2000Api(session).get_meldingen({}, "1")
+
+    assert [melding["id"] for melding in meldingen] == [3, 2]
+    assert threads and threads[0] != threading.get_ident()
+    assert "gzip" in session.headers["Accept-Encoding"]
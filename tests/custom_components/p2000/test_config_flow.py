@@ -8,9 +8,14 @@ from custom_components.p2000.const import (
     CONF_DISCIPLINES,
     CONF_GEMEENTEN,
     CONF_ICON,
+    CONF_NOTIFY_RATE,
+    CONF_NOTIFY_TARGETS,
     CONF_PRIO1,
     CONF_REGIOS,
+    CONF_SCAN_INTERVAL,
     DEFAULT_ICON,
+    DEFAULT_NOTIFY_RATE,
+    DEFAULT_SCAN_INTERVAL,
 )
 
 
@@ -25,6 +30,8 @@ def test_normalize_config_converts_text_fields_to_lists() -> None:
             CONF_REGIOS: "10,25,999",
             CONF_DISCIPLINES: ["2", "3", "99"],
             CONF_PRIO1: "true",
+            CONF_NOTIFY_TARGETS: "notify.mobile_app_phone\nmobile_app_tablet",
+            CONF_NOTIFY_RATE: 30.0,
         }
     )
 
@@ -33,6 +40,11 @@ def test_normalize_config_converts_text_fields_to_lists() -> None:
     assert result[CONF_REGIOS] == ["10", "25"]
     assert result[CONF_DISCIPLINES] == ["2", "3"]
     assert result[CONF_PRIO1] is True
+    assert result[CONF_NOTIFY_TARGETS] == [
+        "notify.mobile_app_phone",
+        "mobile_app_tablet",
+    ]
+    assert result[CONF_NOTIFY_RATE] == 30
 
 
 def test_normalize_config_applies_defaults() -> None:
@@ -46,3 +58,6 @@ def test_normalize_config_applies_defaults() -> None:
     assert result[CONF_REGIOS] == []
     assert result[CONF_DISCIPLINES] == []
     assert result[CONF_PRIO1] is False
+    assert result[CONF_SCAN_INTERVAL] == DEFAULT_SCAN_INTERVAL
+    assert result[CONF_NOTIFY_TARGETS] == []
+    assert result[CONF_NOTIFY_RATE] == DEFAULT_NOTIFY_RATE
@@ -0,0 +1,179 @@
+"""Tests for the P2000 coordinator."""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from homeassistant.const import CONF_NAME
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.p2000 import async_update_options
+from custom_components.p2000.config_flow import _normalize_config
+from custom_components.p2000.const import (
+    CONF_CAPCODES,
+    CONF_ICON,
+    CONF_REGIOS,
+    CONF_SCAN_INTERVAL,
+    DEFAULT_ICON,
+    DOMAIN,
+)
+from custom_components.p2000.coordinator import (
+    P2000DataUpdateCoordinator,
+    melding_matches_filter,
+)
+
+MELDING = {
+    "id": "1",
+    "plaats": "Zwolle",
+    "gemeente": "Zwolle",
+    "regioid": "17",
+    "dienstid": "2",
+    "prio1": "1",
+    "capcodes": [{"capcode": "0101001", "omschrijving": "Brandweer Zwolle"}],
+}
+
+
+class FakeApi:
+    """API returning queued responses and recording the known ids."""
+
+    def __init__(self, *responses):
+        """Initialize the API."""
+        self.responses = list(responses)
+        self.known_ids = []
+
+    async def get_meldingen(self, api_filter, known_id=None):
+        """Return the next response."""
+        self.known_ids.append(known_id)
+        return self.responses.pop(0) if self.responses else None
+
+
+def test_melding_matches_filter() -> None:
+    """Test cached meldingen are re-filtered against a new filter."""
+    assert melding_matches_filter(MELDING, {})
+    assert melding_matches_filter(MELDING, {"capcodes": ["101001"], "prio1": True})
+    assert melding_matches_filter(MELDING, {"gemeenten": ["zwolle"], "regios": ["17"]})
+    assert not melding_matches_filter(MELDING, {"capcodes": ["0202002"]})
+    assert not melding_matches_filter(MELDING, {"gemeenten": ["Kampen"]})
+    assert not melding_matches_filter(MELDING, {"regios": ["17"], "disciplines": ["3"]})
+    assert not melding_matches_filter({**MELDING, "prio1": "0"}, {"prio1": True})
+
+
+def test_melding_matches_filter_keeps_meldingen_with_missing_fields() -> None:
+    """Test missing melding fields do not drop the melding."""
+    assert melding_matches_filter({"id": "1"}, {"regios": ["17"], "gemeenten": ["Zwolle"]})
+    # A place name is not a municipality, so it is not compared to gemeenten.
+    assert melding_matches_filter(
+        {"id": "1", "plaats": "Haarlem-Noord"}, {"gemeenten": ["Haarlem"]}
+    )
+
+
+async def test_new_meldingen_are_dispatched_oldest_first(hass) -> None:
+    """Test a poll dispatches new meldingen in order and keeps the newest."""
+    api = FakeApi(
+        [{**MELDING, "id": "1"}],
+        [{**MELDING, "id": "3"}, {**MELDING, "id": "2"}],
+    )
+    coordinator = P2000DataUpdateCoordinator(hass, api, {})
+    dispatched = []
+    coordinator.async_add_melding_listener(
+        lambda melding: dispatched.append(melding["id"])
+    )
+
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+
+    assert dispatched == ["1", "2", "3"]
+    assert coordinator.data["id"] == "3"
+    assert api.known_ids == [None, "1"]
+    assert [melding["id"] for _, melding in coordinator.recent] == ["3", "2", "1"]
+
+
+async def test_update_filter_skips_dispatch_and_clears_stale_data(hass) -> None:
+    """Test a new filter re-filters the cache without notifying its first result."""
+    api = FakeApi([MELDING], [{**MELDING, "id": "2", "regioid": "25"}])
+    coordinator = P2000DataUpdateCoordinator(hass, api, {}, update_interval=30)
+    await coordinator.async_refresh()
+    dispatched = []
+    coordinator.async_add_melding_listener(dispatched.append)
+
+    coordinator.async_update_filter({"regios": ["25"]}, 60)
+
+    assert coordinator.update_interval == timedelta(seconds=60)
+    assert coordinator.data == {}
+    assert not coordinator.recent
+
+    await coordinator.async_refresh()
+
+    assert coordinator.data["id"] == "2"
+    assert dispatched == []
+    assert api.known_ids == [None, None]
+
+
+async def test_failed_poll_after_filter_change_keeps_baseline(hass) -> None:
+    """Test a failed poll does not turn the backlog of a new filter into alarms."""
+    api = FakeApi(
+        [MELDING],
+        None,
+        [{**MELDING, "id": "3", "regioid": "25"}, {**MELDING, "id": "2"}],
+        [{**MELDING, "id": "4"}],
+    )
+    coordinator = P2000DataUpdateCoordinator(hass, api, {"regios": ["17"]})
+    await coordinator.async_refresh()
+    dispatched = []
+    coordinator.async_add_melding_listener(
+        lambda melding: dispatched.append(melding["id"])
+    )
+
+    coordinator.async_update_filter({"regios": ["17", "25"]}, 30)
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+
+    assert dispatched == []
+    assert coordinator.data["id"] == "3"
+    assert [melding["id"] for _, melding in coordinator.recent] == ["1"]
+
+    await coordinator.async_refresh()
+
+    assert dispatched == ["4"]
+    assert api.known_ids == [None, None, None, "3"]
+
+
+async def test_update_options_applies_filter_without_reload(hass) -> None:
+    """Test filter options are hot-applied and other options reload the entry."""
+    config = {CONF_NAME: "P2000", CONF_ICON: DEFAULT_ICON, CONF_REGIOS: ["17"]}
+    entry = MockConfigEntry(domain=DOMAIN, data=config, version=2)
+    entry.add_to_hass(hass)
+    coordinator = P2000DataUpdateCoordinator(
+        hass, FakeApi(), {"regios": ["17"]}, entry_config=config
+    )
+    hass.data[DOMAIN] = {entry.entry_id: coordinator}
+
+    with patch.object(hass.config_entries, "async_reload") as reload:
+        hass.config_entries.async_update_entry(
+            entry,
+            options=_normalize_config(
+                {**config, CONF_CAPCODES: "0101001", CONF_SCAN_INTERVAL: 120}
+            ),
+        )
+        await async_update_options(hass, entry)
+
+        assert not reload.called
+        assert coordinator.api_filter == {"regios": ["17"], "capcodes": ["0101001"]}
+        assert coordinator.update_interval == timedelta(seconds=120)
+
+        hass.config_entries.async_update_entry(
+            entry, options={**entry.options, CONF_NAME: "P2000 Zwolle"}
+        )
+        await async_update_options(hass, entry)
+
+        reload.assert_called_once_with(entry.entry_id)
+
+    await coordinator.async_shutdown()
+
+
+async def test_recent_versions_are_not_reused_by_new_coordinators(hass) -> None:
+    """Test a reloaded coordinator never repeats a cached version."""
+    old = P2000DataUpdateCoordinator(hass, FakeApi([MELDING]), {})
+    await old.async_refresh()
+    new = P2000DataUpdateCoordinator(hass, FakeApi(), {})
+
+    assert new.recent_version > old.recent_version
@@ -0,0 +1,85 @@
+"""Tests for the P2000 GeoJSON view helpers."""
+
+from datetime import datetime, timedelta, timezone
+import json
+
+import pytest
+
+from custom_components.p2000.geojson import (
+    _etag_matches,
+    _parse_query,
+    build_feature_collection,
+)
+
+NOW = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+RECENT = [
+    (
+        NOW - timedelta(minutes=10),
+        {"id": "3", "dienstid": "2", "latitude": "52,51", "longitude": "6,09"},
+    ),
+    (
+        NOW - timedelta(minutes=30),
+        {"id": "2", "dienst": "Ambulance", "latitude": 52.0, "longitude": 5.1},
+    ),
+    (NOW - timedelta(minutes=40), {"id": "1", "dienstid": "2"}),
+    (
+        NOW - timedelta(hours=3),
+        {"id": "0", "dienstid": "2", "latitude": 52.5, "longitude": 6.0},
+    ),
+]
+
+
+def _ids(body: bytes) -> list[str]:
+    """Return the feature ids of a serialized FeatureCollection."""
+    return [feature["id"] for feature in json.loads(body)["features"]]
+
+
+def test_build_feature_collection_filters() -> None:
+    """Test the bbox, discipline and time window filters."""
+    body, stale_at = build_feature_collection(RECENT, (None, None, None), NOW)
+    assert _ids(body) == ["3", "2", "0"]
+    assert stale_at is None
+    assert json.loads(body)["features"][0]["geometry"]["coordinates"] == [6.09, 52.51]
+
+    body, stale_at = build_feature_collection(RECENT, (None, "2", 1.0), NOW)
+    assert _ids(body) == ["3"]
+    assert stale_at == NOW + timedelta(minutes=50)
+
+    body, _ = build_feature_collection(RECENT, (None, "ambulance", None), NOW)
+    assert _ids(body) == ["2"]
+
+    bbox = (6.0, 52.4, 6.2, 52.6)
+    body, _ = build_feature_collection(RECENT, (bbox, None, None), NOW)
+    assert _ids(body) == ["3", "0"]
+
+
+def test_parse_query_rejects_invalid_values() -> None:
+    """Test query parameters are validated and normalized."""
+    assert _parse_query({"discipline": " Brandweer ", "hours": "2"}) == (
+        None,
+        "brandweer",
+        2.0,
+    )
+    for query in (
+        {"bbox": "1,2,3"},
+        {"bbox": "1,2,3,nan"},
+        {"hours": "0"},
+        {"hours": "nan"},
+        {"hours": "inf"},
+        {"hours": "1e10"},
+    ):
+        with pytest.raises(ValueError):
+            _parse_query(query)
+
+
+def test_etag_matches_header_lists() -> None:
+    """Test If-None-Match with weak tags, several tags and a wildcard."""
+    etag = '"abc"'
+
+    assert _etag_matches('"abc"', etag)
+    assert _etag_matches('W/"abc"', etag)
+    assert _etag_matches('"old", W/"abc"', etag)
+    assert _etag_matches("*", etag)
+    assert not _etag_matches('"old"', etag)
+    assert not _etag_matches(None, etag)
@@ -0,0 +1,13 @@
+"""Tests for the shared P2000 helpers."""
+
+from custom_components.p2000.helpers import to_float
+
+
+def test_to_float_accepts_comma_decimal_separator() -> None:
+    """Test Dutch comma decimal values become floats."""
+    assert to_float("52,12345") == 52.12345
+    assert to_float("4.98765") == 4.98765
+    assert to_float(5) == 5.0
+    assert to_float("") is None
+    assert to_float(None) is None
+    assert to_float("not-a-number") is None
@@ -0,0 +1,135 @@
+"""Tests for P2000 incident clustering."""
+
+from custom_components.p2000.incidents import IncidentClusterer
+
+
+def test_follow_up_pages_join_the_same_incident() -> None:
+    """Test meldingen are merged by address, location and GRIP level."""
+    clusterer = IncidentClusterer(window=600, radius=500)
+
+    first, created = clusterer.add(
+        {
+            "id": "1",
+            "straat": "Grote Markt",
+            "plaats": "Zwolle",
+            "latitude": "52,5125",
+            "longitude": "6,0920",
+            "capcodes": [{"capcode": "0101"}],
+        },
+        now=0.0,
+    )
+    assert created
+
+    same_address, created = clusterer.add(
+        {
+            "id": "2",
+            "straat": "grote  markt",
+            "plaats": "ZWOLLE",
+            "capcodes": [{"capcode": "0202"}],
+        },
+        now=60.0,
+    )
+    assert not created
+    assert same_address is first
+
+    nearby, created = clusterer.add(
+        {
+            "id": "3",
+            "latitude": 52.5140,
+            "longitude": 6.0930,
+            "grip": "1",
+            "regio": "IJsselland",
+        },
+        now=120.0,
+    )
+    assert not created
+    assert nearby is first
+
+    escalation, created = clusterer.add(
+        {"id": "4", "grip": "2", "regio": "IJsselland"},
+        now=180.0,
+    )
+    assert not created
+    assert escalation is first
+
+    assert first.member_count == 4
+    assert first.escalation_level == 2
+    assert first.capcodes == {"0101", "0202"}
+    assert len(clusterer) == 1
+
+
+def test_unrelated_grip_incidents_in_a_region_stay_apart() -> None:
+    """Test GRIP meldingen at the same level only merge on address or location."""
+    clusterer = IncidentClusterer(window=600, radius=500)
+
+    first, _ = clusterer.add(
+        {
+            "id": "1",
+            "straat": "Grote Markt",
+            "plaats": "Zwolle",
+            "grip": "1",
+            "regio": "IJsselland",
+        },
+        now=0.0,
+    )
+    second, created = clusterer.add(
+        {
+            "id": "2",
+            "straat": "Oudestraat",
+            "plaats": "Kampen",
+            "grip": "1",
+            "regio": "IJsselland",
+        },
+        now=60.0,
+    )
+    assert created
+    assert second is not first
+
+    update, created = clusterer.add(
+        {"id": "3", "grip": "1", "regio": "IJsselland"}, now=120.0
+    )
+    assert not created
+    assert update is second
+    assert len(clusterer) == 2
+
+
+def test_incidents_expire_after_the_window() -> None:
+    """Test a quiet incident is no longer matched."""
+    clusterer = IncidentClusterer(window=600, radius=500)
+
+    first, _ = clusterer.add(
+        {"id": "1", "straat": "Markt", "plaats": "Kampen"}, now=0.0
+    )
+    second, created = clusterer.add(
+        {"id": "2", "straat": "Markt", "plaats": "Kampen"}, now=700.0
+    )
+
+    assert created
+    assert second is not first
+    assert len(clusterer) == 1
+
+
+def test_incident_ids_do_not_depend_on_melding_ids() -> None:
+    """Test meldingen without or with repeated ids get separate incidents."""
+    clusterer = IncidentClusterer(window=600, radius=500)
+
+    first, _ = clusterer.add({"straat": "Markt", "plaats": "Kampen"}, now=0.0)
+    second, created = clusterer.add(
+        {"straat": "Kerkstraat", "plaats": "Zwolle"}, now=1.0
+    )
+    third, _ = clusterer.add(
+        {"id": "7", "straat": "Markt", "plaats": "Kampen"}, now=2.0
+    )
+
+    assert created
+    assert first.id != second.id
+    assert third is first
+    assert first.melding_id is None
+    assert len(clusterer) == 2
+
+    other, created = clusterer.add(
+        {"id": "7", "straat": "Dorpsstraat", "plaats": "Dalfsen"}, now=3.0
+    )
+    assert created
+    assert other.melding_id == "7"
+    assert len(clusterer) == 3
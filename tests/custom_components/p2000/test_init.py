@@ -2,14 +2,17 @@
 
 from homeassistant.const import CONF_NAME
 
-from custom_components.p2000 import _migrate_mapping
+from custom_components.p2000 import _migrate_mapping, _requires_reload
+from custom_components.p2000.config_flow import _normalize_config
 from custom_components.p2000.const import (
     CONF_CAPCODES,
     CONF_DISCIPLINES,
     CONF_GEMEENTEN,
     CONF_ICON,
+    CONF_NOTIFY_TARGETS,
     CONF_PRIO1,
     CONF_REGIOS,
+    CONF_SCAN_INTERVAL,
     DEFAULT_ICON,
 )
 
@@ -33,3 +36,25 @@ def test_migrate_mapping_normalizes_old_storage_shape() -> None:
     assert result[CONF_DISCIPLINES] == ["2"]
     assert result[CONF_PRIO1] is True
     assert result[CONF_ICON] == DEFAULT_ICON
+
+
+def test_requires_reload_only_for_non_filter_options() -> None:
+    """Test filter and interval changes are applied without a reload."""
+    old = {CONF_NAME: "P2000", CONF_CAPCODES: ["123"], CONF_SCAN_INTERVAL: 30}
+
+    assert not _requires_reload(
+        old, {**old, CONF_CAPCODES: ["456"], CONF_PRIO1: True, CONF_SCAN_INTERVAL: 60}
+    )
+    assert _requires_reload(old, {**old, CONF_NAME: "Brandweer"})
+
+
+def test_requires_reload_ignores_defaults_missing_from_old_entries() -> None:
+    """Test options saved with defaults do not reload an older entry."""
+    old = {CONF_NAME: "P2000", CONF_ICON: DEFAULT_ICON, CONF_REGIOS: ["17"]}
+
+    assert not _requires_reload(
+        old, _normalize_config({**old, CONF_REGIOS: ["17", "25"]})
+    )
+    assert _requires_reload(
+        old, _normalize_config({**old, CONF_NOTIFY_TARGETS: "notify.phone"})
+    )
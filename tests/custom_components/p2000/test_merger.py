@@ -0,0 +1,118 @@
+"""Tests for merging meldingen from several P2000 sources."""
+
+import asyncio
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.p2000 import merger as merger_module
+from custom_components.p2000.const import DOMAIN
+from custom_components.p2000.merger import (
+    P2000SourceMerger,
+    content_hash,
+    melding_timestamp,
+)
+
+MELDING = {
+    "id": "1",
+    "melding": "P 1 BDH-01 Woningbrand Zwolle",
+    "datum": "01-01-26",
+    "tijd": "12:00:00",
+    "capcodes": [{"capcode": "0101001"}, {"capcode": "0101002"}],
+}
+
+
+class FakeSource:
+    """Source returning fixed meldingen after a delay."""
+
+    def __init__(self, meldingen, delay=0.0):
+        """Initialize the source."""
+        self.meldingen = meldingen
+        self.delay = delay
+        self.known_ids = []
+        self.api_filters = []
+
+    async def get_meldingen(self, api_filter, known_id=None):
+        """Return the meldingen."""
+        self.known_ids.append(known_id)
+        self.api_filters.append(api_filter)
+        await asyncio.sleep(self.delay)
+        return self.meldingen
+
+
+def test_content_hash_ignores_source_ids_and_formatting() -> None:
+    """Test copies from different sources share a content hash."""
+    copy = {
+        **MELDING,
+        "id": "abc",
+        "melding": "p 1 bdh-01  woningbrand zwolle",
+        "capcodes": [{"capcode": "101002"}, {"capcode": "101001"}],
+    }
+
+    assert content_hash(copy) == content_hash(MELDING)
+    assert content_hash({**MELDING, "tijd": "12:00:01"}) != content_hash(MELDING)
+
+
+def _merger(hass, sources) -> P2000SourceMerger:
+    """Return a merger for a mock config entry."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+    return P2000SourceMerger(hass, entry, sources)
+
+
+def test_melding_timestamp_parses_datum_and_tijd() -> None:
+    """Test short and long dates parse, other values use the default."""
+    short = melding_timestamp(MELDING, 0.0)
+
+    assert melding_timestamp({**MELDING, "datum": "01-01-2026"}, 0.0) == short
+    assert melding_timestamp({**MELDING, "tijd": "12:00:01"}, 0.0) == short + 1
+    assert melding_timestamp({"datum": "gisteren"}, 5.0) == 5.0
+    assert melding_timestamp({}, 5.0) == 5.0
+
+
+async def test_merger_delivers_first_copy_once(hass) -> None:
+    """Test a melding from two sources is delivered once."""
+    fast = FakeSource([MELDING])
+    slow = FakeSource([{**MELDING, "id": "other"}], delay=0.01)
+    merger = _merger(hass, {"fast": fast, "slow": slow})
+
+    assert await merger.get_meldingen({}) == [MELDING]
+    assert await merger.get_meldingen({}, "1") is None
+    assert fast.known_ids == [None, "1"]
+    assert slow.known_ids == [None, "other"]
+
+    stats = merger.as_dict()
+    assert stats["fast"]["first"] == 1
+    assert stats["fast"]["duplicates"] == 1
+    assert stats["slow"]["first"] == 0
+    assert stats["slow"]["duplicates"] == 2
+    assert stats["slow"]["lag"] is not None
+
+
+async def test_merger_returns_newest_first_across_sources(hass) -> None:
+    """Test meldingen are ordered by their time, not by the source order."""
+    one = {**MELDING, "id": "one", "melding": "Een", "tijd": "12:00:00"}
+    two = {**MELDING, "id": "two", "melding": "Twee", "tijd": "12:01:00"}
+    three = {**MELDING, "id": "three", "melding": "Drie", "tijd": "12:02:00"}
+    merger = _merger(
+        hass, {"a": FakeSource([two, one]), "b": FakeSource([three], delay=0.01)}
+    )
+
+    meldingen = await merger.get_meldingen({})
+
+    assert [melding["id"] for melding in meldingen] == ["three", "two", "one"]
+
+
+async def test_merger_drops_fetches_for_an_old_filter(hass, monkeypatch) -> None:
+    """Test a fetch still running for a previous filter is not merged."""
+    monkeypatch.setattr(merger_module, "GRACE_PERIOD", 0.01)
+    fast = FakeSource(None)
+    slow = FakeSource([MELDING], delay=0.1)
+    merger = _merger(hass, {"fast": fast, "slow": slow})
+
+    assert await merger.get_meldingen({"regios": ["17"]}) is None
+    assert await merger.get_meldingen({"regios": ["25"]}) is None
+    await asyncio.sleep(0.15)
+    assert await merger.get_meldingen({"regios": ["25"]}) == [MELDING]
+
+    assert slow.api_filters == [{"regios": ["17"]}, {"regios": ["25"]}]
+    assert merger.as_dict()["slow"]["requests"] == 1
@@ -0,0 +1,96 @@
+"""Tests for the P2000 notification helpers."""
+
+import asyncio
+
+from pytest_homeassistant_custom_component.common import async_mock_service
+
+from custom_components.p2000.notifier import (
+    P2000Notifier,
+    TokenBucket,
+    _build_message,
+    _dedupe_key,
+    _notify_service,
+)
+
+
+def test_token_bucket_allows_burst_then_refills() -> None:
+    """Test the bucket empties after a burst and refills over time."""
+    bucket = TokenBucket(rate=0.5, capacity=2, now=0.0)
+
+    assert bucket.consume(now=0.0)
+    assert bucket.consume(now=0.0)
+    assert not bucket.consume(now=0.0)
+    assert bucket.time_until_token(now=1.0) == 1.0
+    assert bucket.consume(now=2.0)
+    assert not bucket.consume(now=2.0)
+
+
+def test_dedupe_key_ignores_case_and_whitespace() -> None:
+    """Test repeated pages with the same text share a key."""
+    first = {"id": "1", "melding": "P 1 BDH-01 Woningbrand  Zwolle"}
+    repeat = {"id": "2", "melding": "p 1 bdh-01 woningbrand zwolle"}
+
+    assert _dedupe_key(first) == _dedupe_key(repeat)
+    assert _dedupe_key({"id": "3"}) == "3"
+
+
+def test_build_message_collapses_meldingen_into_digest() -> None:
+    """Test a single melding and a digest of several."""
+    first = {"melding": "Woningbrand", "plaats": "Zwolle", "dienst": "Brandweer"}
+    second = {"melding": "Ambulance A1", "plaats": "Kampen", "tijd": "12:01"}
+
+    assert _build_message([first]) == {
+        "title": "P2000 Brandweer",
+        "message": "Woningbrand (Zwolle)",
+    }
+    assert _build_message([first, second]) == {
+        "title": "P2000: 2 meldingen",
+        "message": "Woningbrand (Zwolle)\n12:01 Ambulance A1 (Kampen)",
+    }
+
+
+def test_notify_service_strips_domain() -> None:
+    """Test targets may be given with or without the notify domain."""
+    assert _notify_service("notify.mobile_app_phone") == "mobile_app_phone"
+    assert _notify_service("mobile_app_phone") == "mobile_app_phone"
+
+
+async def test_run_collapses_throttled_meldingen_into_digest(hass) -> None:
+    """Test meldingen queued while throttled are sent as one digest."""
+    calls = async_mock_service(hass, "notify", "phone")
+    notifier = P2000Notifier(hass, ["notify.phone"], 36000)
+    target = notifier._targets[0]
+    while target.bucket.consume():
+        pass
+
+    notifier.async_handle_melding({"id": "1", "melding": "Woningbrand Zwolle"})
+    notifier.async_handle_melding({"id": "2", "melding": "woningbrand  zwolle"})
+    notifier.async_handle_melding({"id": "3", "melding": "Ambulance A1 Kampen"})
+    assert target.queue.qsize() == 2
+
+    task = hass.async_create_task(notifier._async_run(target))
+    await asyncio.sleep(0.3)
+    task.cancel()
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert calls[0].data["title"] == "P2000: 2 meldingen"
+
+
+async def test_send_errors_do_not_stop_delivery(hass) -> None:
+    """Test a failing notify service does not end the delivery task."""
+
+    async def failing_service(call) -> None:
+        raise ValueError("invalid data")
+
+    hass.services.async_register("notify", "phone", failing_service)
+    notifier = P2000Notifier(hass, ["notify.phone"], 3600)
+    target = notifier._targets[0]
+
+    task = hass.async_create_task(notifier._async_run(target))
+    notifier.async_handle_melding({"id": "1", "melding": "Woningbrand Zwolle"})
+    await asyncio.sleep(0.05)
+
+    assert not task.done()
+    task.cancel()
+    await hass.async_block_till_done()
@@ -1,13 +1,16 @@
 """Tests for P2000 sensor helpers."""
 
-from custom_components.p2000.sensor import _to_float
+from custom_components.p2000.sensor import _dienst_regio_keys, _prio1_keys
 
 
-def test_to_float_accepts_comma_decimal_separator() -> None:
-    """Test Dutch comma decimal values become floats."""
-    assert _to_float("52,12345") == 52.12345
-    assert _to_float("4.98765") == 4.98765
-    assert _to_float(5) == 5.0
-    assert _to_float("") is None
-    assert _to_float(None) is None
-    assert _to_float("not-a-number") is None
+def test_statistics_melding_keys() -> None:
+    """Test which keys a melding is counted under."""
+    melding = {"dienst": "Brandweer", "regio": "IJsselland", "prio1": "1"}
+
+    assert tuple(_dienst_regio_keys(melding)) == (
+        "dienst:Brandweer",
+        "regio:IJsselland",
+    )
+    assert tuple(_dienst_regio_keys({})) == ("dienst:Onbekend", "regio:Onbekend")
+    assert _prio1_keys(melding) == ()
+    assert _prio1_keys({"prio1": "0"}) is None
@@ -0,0 +1,46 @@
+"""Tests for the P2000 alarm statistics helpers."""
+
+from datetime import datetime, timezone
+
+from custom_components.p2000.stats import (
+    SlidingWindowCounter,
+    hourly_statistics,
+    statistic_id,
+)
+
+
+def test_sliding_window_counter_expires_old_buckets() -> None:
+    """Test events drop out of the window bucket by bucket."""
+    counter = SlidingWindowCounter(window=60, buckets=6, now=0.0)
+
+    counter.add(("dienst:Brandweer",), now=0.0)
+    counter.add(("dienst:Ambulance",), now=25.0)
+    counter.add(("dienst:Brandweer",), now=35.0)
+
+    assert counter.total(now=35.0) == 3
+    assert counter.counts(now=35.0) == {"dienst:Brandweer": 2, "dienst:Ambulance": 1}
+    assert counter.total(now=65.0) == 2
+    assert counter.counts(now=85.0) == {"dienst:Brandweer": 1}
+    assert counter.total(now=1000.0) == 0
+    assert counter.counts(now=1000.0) == {}
+
+
+def test_hourly_statistics_publishes_zero_for_quiet_keys() -> None:
+    """Test every known key gets a value for the hour."""
+    start = datetime(2026, 1, 1, 11, 0, tzinfo=timezone.utc)
+
+    statistics = hourly_statistics(
+        "01ABC",
+        "P2000",
+        {"dienst:Brandweer": 3},
+        {"dienst:Brandweer", "regio:IJsselland"},
+        start,
+    )
+
+    assert [metadata["statistic_id"] for metadata, _ in statistics] == [
+        "p2000:01abc_dienst_brandweer",
+        "p2000:01abc_regio_ijsselland",
+    ]
+    assert statistics[0][1] == [{"start": start, "mean": 3, "min": 3, "max": 3}]
+    assert statistics[1][1][0]["mean"] == 0
+    assert statistic_id("01ABC", "dienst:Politie") == "p2000:01abc_dienst_politie"